@@ -1,6 +1,7 @@
+import os
 import re
 import warnings
-from datetime import datetime
+from collections.abc import Iterator
 from pathlib import Path
 
 from beneuro_data.extra_file_handling import _find_whitelisted_files_in_root
@@ -8,6 +9,18 @@ from beneuro_data.extra_file_handling import _find_whitelisted_files_in_root
 # this is the expected format the end of the session folder should have
 # e.g. M016_2023_08_15_16_00
 EXPECTED_DATE_FORMAT: str = "%Y_%m_%d_%H_%M"
+# length of a date string in the expected format, e.g. 2023_08_15_16_00
+_EXPECTED_DATE_LENGTH: int = len("YYYY_MM_DD_HH_MM")
+# structure of EXPECTED_DATE_FORMAT with the fields captured in order
+_EXPECTED_DATE_RE = re.compile(r"(\d{4})_(\d{2})_(\d{2})_(\d{2})_(\d{2})", re.ASCII)
+
+# matches the end of a SpikeGLX recording folder's name, e.g. M016_2023_08_15_16_00_g1
+# TODO can there be multiple numbers after the _g?
+_SPIKEGLX_GID_RE = re.compile(r"_g(\d)$")
+
+# a directory tree listed up front with os.walk:
+# maps each directory to the names of its (subdirectories, files)
+DirectoryListing = dict[str, tuple[list[str], list[str]]]
 
 
 class WrongNumberOfFilesError(Exception):
@@ -25,6 +38,7 @@ def validate_raw_session(
     include_nwb: bool = False,
     include_pyaldata: bool = False,
     include_kilosort: bool = False,
+    listing: DirectoryListing | None = None,
 ):
     """
     Validate the files of a raw session.
@@ -49,6 +63,10 @@ def validate_raw_session(
         For what's allowed in the root, use `whitelisted_files_in_root`.
     include_kilosort : bool, default: False
         Whether to upload the Kilosort output.
+    listing : DirectoryListing, optional
+        Listing of the session's directory tree made in advance, e.g. by
+        `validate_raw_sessions_batch`. If given, the behavior, ephys and video validators
+        read the directory contents from it instead of listing them again.
 
     Returns
     -------
@@ -63,16 +81,30 @@ def validate_raw_session(
     nwb_files = []
     pyaldata_files = []
 
+    # validate the session's path once here instead of in every validator below
+    if include_behavior or include_ephys or include_videos:
+        validate_session_path(session_path, subject_name)
+
     if include_behavior:
         behavior_files = validate_raw_behavioral_data_of_session(
-            session_path, subject_name, whitelisted_files_in_root
+            session_path,
+            subject_name,
+            whitelisted_files_in_root,
+            _skip_path_validation=True,
+            listing=listing,
         )
     if include_ephys:
         ephys_files = validate_raw_ephys_data_of_session(
-            session_path, subject_name, allowed_extensions_not_in_root
+            session_path,
+            subject_name,
+            allowed_extensions_not_in_root,
+            _skip_path_validation=True,
+            listing=listing,
         )
     if include_videos:
-        video_files = validate_raw_videos_of_session(session_path, subject_name)
+        video_files = validate_raw_videos_of_session(
+            session_path, subject_name, _skip_path_validation=True, listing=listing
+        )
     if include_kilosort:
         kilosort_files = validate_kilosort(session_path)
     if include_nwb:
@@ -83,25 +115,155 @@ def validate_raw_session(
     return behavior_files, ephys_files, video_files, nwb_files, pyaldata_files, kilosort_files
 
 
+def validate_raw_sessions_batch(
+    parent_path: Path,
+    subject_names: tuple[str, ...],
+    include_behavior: bool,
+    include_ephys: bool,
+    include_videos: bool,
+    whitelisted_files_in_root: tuple[str, ...],
+    allowed_extensions_not_in_root: tuple[str, ...],
+) -> tuple[dict[Path, tuple], dict[Path, Exception]]:
+    """
+    Validate all raw sessions of the given subjects.
+    The subjects' folders are listed in a single walk, and the sessions are validated
+    against that listing instead of each of them listing their own folders again.
+
+    Parameters
+    ----------
+    parent_path : Path
+        Path to the folder containing the subjects' folders, e.g. the raw data folder.
+    subject_names : tuple[str, ...]
+        Names of the subjects whose sessions to validate.
+    include_behavior : bool
+        Whether to validate the behavioral data.
+    include_ephys : bool
+        Whether to validate the ephys data.
+    include_videos : bool
+        Whether to validate the video data.
+    whitelisted_files_in_root : tuple[str, ...]
+        A tuple of filenames that are allowed in the root of the session directory.
+    allowed_extensions_not_in_root : tuple[str, ...]
+        A tuple of file extensions that are allowed in the session directory excluding the root level.
+        E.g. (".txt", )
+        For what's allowed in the root, use `whitelisted_files_in_root`.
+
+    Returns
+    -------
+    valid_sessions : dict[Path, tuple]
+        The output of `validate_raw_session` for each session that passed validation.
+    invalid_sessions : dict[Path, Exception]
+        The error raised for each session that didn't pass validation.
+    """
+    # absolute so that the walked paths are written the same way as the Paths made from them
+    parent_str = os.fspath(parent_path.absolute())
+
+    listing = {}
+    for root, dirnames, filenames in os.walk(parent_str):
+        # only descend into the subjects we are interested in
+        if root == parent_str:
+            dirnames[:] = [name for name in dirnames if name in subject_names]
+        listing[root] = (dirnames, filenames)
+
+    valid_sessions = {}
+    invalid_sessions = {}
+    for subject_name in subject_names:
+        subject_str = os.path.join(parent_str, subject_name)
+        if subject_str not in listing:
+            continue
+
+        session_names, _ = listing[subject_str]
+        for session_name in session_names:
+            session_path = Path(subject_str, session_name)
+            try:
+                valid_sessions[session_path] = validate_raw_session(
+                    session_path,
+                    subject_name,
+                    include_behavior,
+                    include_ephys,
+                    include_videos,
+                    whitelisted_files_in_root,
+                    allowed_extensions_not_in_root,
+                    listing=listing,
+                )
+            except Exception as e:
+                invalid_sessions[session_path] = e
+
+    return valid_sessions, invalid_sessions
+
+
+def _list_directory(
+    directory: Path | str, listing: DirectoryListing | None = None
+) -> tuple[list[str], list[str]]:
+    """
+    List the names of the subdirectories and files in a directory.
+    Read from `listing` if the directory is in it, otherwise list it with os.scandir.
+    """
+    directory = os.fspath(directory)
+    if listing is not None and directory in listing:
+        return listing[directory]
+
+    # scandir gives the entry types without an extra stat call per entry
+    dirnames = []
+    filenames = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirnames.append(entry.name)
+            else:
+                filenames.append(entry.name)
+
+    return dirnames, filenames
+
+
+def _walk(
+    top: Path | str, listing: DirectoryListing | None = None
+) -> Iterator[tuple[str, list[str], list[str]]]:
+    """
+    Same as os.walk, but read the tree from `listing` if `top` is in it.
+    """
+    top = os.fspath(top)
+    if listing is None or top not in listing:
+        yield from os.walk(top)
+        return
+
+    stack = [top]
+    while len(stack) > 0:
+        root = stack.pop()
+        # yield a copy so that callers can prune it like with os.walk
+        # without changing the shared listing
+        dirnames = list(listing[root][0])
+        yield root, dirnames, listing[root][1]
+
+        # like os.walk, the listing doesn't descend into symlinks to directories
+        for dirname in reversed(dirnames):
+            dir_str = os.path.join(root, dirname)
+            if dir_str in listing:
+                stack.append(dir_str)
+
+
 def validate_date_format(extracted_date_str: str) -> bool:
     """
     Validate that the date extracted from a session name is in the expected format.
 
     Returns True if the date string is in the expected format, raises ValueError otherwise.
     """
-    # parsing the string to datetime, then generating the correctly formatted string to compare to
-    try:
-        correct_str = datetime.strptime(extracted_date_str, EXPECTED_DATE_FORMAT).strftime(
-            EXPECTED_DATE_FORMAT
-        )
-    except ValueError:
+    # only needed here, so don't pay for importing it when the module is loaded
+    from datetime import datetime
+
+    # the regex pins the structure including the zero padding,
+    # constructing the datetime checks that the values are in range
+    date_match = _EXPECTED_DATE_RE.fullmatch(extracted_date_str)
+    if date_match is None:
         raise ValueError(
             f"{extracted_date_str} doesn't match expected format of {EXPECTED_DATE_FORMAT}"
         )
 
-    if extracted_date_str != correct_str:
+    try:
+        datetime(*(int(field) for field in date_match.groups()))
+    except ValueError:
         raise ValueError(
-            f"{extracted_date_str} doesn't match expected format of {correct_str}"
+            f"{extracted_date_str} doesn't match expected format of {EXPECTED_DATE_FORMAT}"
         )
 
     return True
@@ -145,6 +307,12 @@ def validate_session_path(session_path: Path, subject_name: str) -> bool:
     # ideally the part after the subject_ is the date and time
     extracted_date_str = folder_name[len(subject_name) + 1 :]
 
+    # a string with the wrong length can be rejected without parsing it
+    if len(extracted_date_str) != _EXPECTED_DATE_LENGTH:
+        raise ValueError(
+            f"{extracted_date_str} doesn't match expected format of {EXPECTED_DATE_FORMAT}"
+        )
+
     validate_date_format(extracted_date_str)
 
     return True
@@ -155,6 +323,8 @@ def validate_raw_behavioral_data_of_session(
     subject_name: str,
     whitelisted_files_in_root: tuple[str, ...],
     warn_if_no_pycontrol_py_folder: bool = True,
+    _skip_path_validation: bool = False,
+    listing: DirectoryListing | None = None,
 ) -> list[Path]:
     """
     Validate behavioral data of a raw session.
@@ -169,6 +339,12 @@ def validate_raw_behavioral_data_of_session(
         A tuple of filenames that are allowed in the root of the session directory.
     warn_if_no_pycontrol_py_folder : bool, default: True
         Whether to warn if the folder containing the PyControl .py task file is not found.
+    _skip_path_validation : bool, default: False
+        Whether to skip validating the session's path.
+        Used by `validate_raw_session`, which validates it once for all validators.
+    listing : DirectoryListing, optional
+        Listing of the session's directory tree made in advance.
+        If given, directory contents are read from it instead of the file system.
 
     Returns
     -------
@@ -177,7 +353,8 @@ def validate_raw_behavioral_data_of_session(
     """
     # have to rename first so that validation passes
     # validate that the session's path and folder name are in the expected format
-    validate_session_path(session_path, subject_name)
+    if not _skip_path_validation:
+        validate_session_path(session_path, subject_name)
 
     # start making a list of files we find
     behavioral_data_files = []
@@ -198,29 +375,43 @@ def validate_raw_behavioral_data_of_session(
     # pycontrol_middle_pattern = rf'{self.session.date.strftime("%Y-%m-%d")}-\d{{6}}'
     pycontrol_middle_pattern = r".*"
 
+    # assemble and compile the full pattern for every extension once
+    pycontrol_pattern_per_extension = {
+        extension: re.compile(pycontrol_start_pattern + pycontrol_middle_pattern + ending)
+        for extension, ending in pycontrol_ending_pattern_per_extension.items()
+    }
+
     # sometimes the experimenter leaves comments in a comment.txt file
     # or saves the trajectory plan in traj_plan.txt/trajectory.txt
     # these files are saved in the whitelist
-    whitelisted_files_found = _find_whitelisted_files_in_root(
-        session_path, whitelisted_files_in_root
-    )
-
-    for extension in pycontrol_ending_pattern_per_extension.keys():
-        pycontrol_pattern_for_extension = (
-            pycontrol_start_pattern
-            + pycontrol_middle_pattern
-            + pycontrol_ending_pattern_per_extension[extension]
-        )
+    # all of them are in the root, so their names are enough to identify them
+    whitelisted_filenames_found = {
+        p.name
+        for p in _find_whitelisted_files_in_root(session_path, whitelisted_files_in_root)
+    }
 
-        # this one is not that precise
-        all_files_with_extension = list(session_path.glob(rf"*{extension}"))
+    # list the root of the session once and sort the entries by the extensions we care about
+    # this one is not that precise
+    root_files_per_extension = {
+        extension: [] for extension in pycontrol_ending_pattern_per_extension.keys()
+    }
+    root_dirnames, root_filenames = _list_directory(session_path, listing)
+    for name in root_dirnames + root_filenames:
+        for extension, files_with_extension in root_files_per_extension.items():
+            if name.endswith(extension):
+                files_with_extension.append(session_path / name)
 
+    for extension, pycontrol_pattern in pycontrol_pattern_per_extension.items():
         pycontrol_files_with_extension = []
-        for ext_file in all_files_with_extension:
-            if ext_file in whitelisted_files_found:
+        for ext_file in root_files_per_extension[extension]:
+            if ext_file.name in whitelisted_filenames_found:
                 continue
 
-            if re.match(pycontrol_pattern_for_extension, ext_file.name) is None:
+            # the prefix check is cheap and rejects most wrongly named files before the regex
+            if (
+                not ext_file.name.startswith(session_path.name)
+                or pycontrol_pattern.match(ext_file.name) is None
+            ):
                 raise ValueError(
                     f"Filename does not match expected pattern for PyControl {extension} files and is not in the whitelist: {ext_file}"
                 )
@@ -250,7 +441,10 @@ def validate_raw_behavioral_data_of_session(
         if warn_if_no_pycontrol_py_folder:
             warnings.warn(f"No PyControl task folder found in {session_path}")
     else:
-        python_files_found = list(py_folder.glob("*.py"))
+        _, py_folder_filenames = _list_directory(py_folder, listing)
+        python_files_found = [
+            py_folder / name for name in py_folder_filenames if name.endswith(".py")
+        ]
 
         if len(python_files_found) > 1:
             raise ValueError(f"More than one .py files found in task folder {session_path}")
@@ -262,7 +456,9 @@ def validate_raw_behavioral_data_of_session(
     return behavioral_data_files
 
 
-def _find_spikeglx_recording_folders_in_session(session_path: Path) -> list[Path]:
+def _find_spikeglx_recording_folders_in_session(
+    session_path: Path, listing: DirectoryListing | None = None
+) -> list[Path]:
     """
     Find the SpikeGLX recording folders in a session.
     These are the folders that end with _gx where x is an integer.
@@ -273,16 +469,22 @@ def _find_spikeglx_recording_folders_in_session(session_path: Path) -> list[Path
     ----------
     session_path : Path
         Path to the session.
+    listing : DirectoryListing, optional
+        Listing of the session's directory tree made in advance.
+        If given, directory contents are read from it instead of the file system.
 
     Returns
     -------
     List of paths to the recording folders.
     """
     # list the folders that look like recordings -> end with _gx
-    spikeglx_recording_folder_pathlib_pattern = "*_g?"
-    recording_folder_paths = list(
-        session_path.glob(spikeglx_recording_folder_pathlib_pattern)
-    )
+    # same as globbing for "*_g?" but with a single listing and no fnmatch
+    root_dirnames, root_filenames = _list_directory(session_path, listing)
+    recording_folder_paths = [
+        session_path / name
+        for name in root_dirnames + root_filenames
+        if name[-3:-1] == "_g"
+    ]
 
     # ideally there is only one recording in a session.
     # warn if there are more
@@ -296,6 +498,8 @@ def validate_raw_ephys_data_of_session(
     session_path: Path,
     subject_name: str,
     allowed_extensions_not_in_root: tuple[str, ...],
+    _skip_path_validation: bool = False,
+    listing: DirectoryListing | None = None,
 ) -> list[Path]:
     """
     Validate electrophysiology data of a raw session.
@@ -310,37 +514,64 @@ def validate_raw_ephys_data_of_session(
         A tuple of file extensions that are allowed in the session directory excluding the root level.
         E.g. (".txt", )
         For what's allowed in the root, use `whitelisted_files_in_root`.
+    _skip_path_validation : bool, default: False
+        Whether to skip validating the session's path.
+        Used by `validate_raw_session`, which validates it once for all validators.
+    listing : DirectoryListing, optional
+        Listing of the session's directory tree made in advance.
+        If given, directory contents are read from it instead of the file system.
 
     Returns
     -------
     List of files in the recording folders.
     """
     # validate that the session's path and folder name are in the expected format
-    validate_session_path(session_path, subject_name)
+    if not _skip_path_validation:
+        validate_session_path(session_path, subject_name)
 
-    recording_folder_paths = _find_spikeglx_recording_folders_in_session(session_path)
+    recording_folder_paths = _find_spikeglx_recording_folders_in_session(
+        session_path, listing
+    )
 
     # validate the structure in the recording folders that we found
     for recording_path in recording_folder_paths:
-        validate_raw_ephys_recording(recording_path, allowed_extensions_not_in_root)
-
-    # search subfolders for spikeglx filetypes and make sure that all of them are in the recording folders found
-    spikeglx_endings = [".lf.meta", ".lf.bin", ".ap.meta", ".ap.bin"]
-    for ending in spikeglx_endings:
-        for spikeglx_filepath in session_path.glob(f"**/*{ending}"):
-            if not any(
-                spikeglx_filepath.is_relative_to(recording_path)
-                for recording_path in recording_folder_paths
-            ):
+        validate_raw_ephys_recording(
+            recording_path, allowed_extensions_not_in_root, listing
+        )
+
+    # walk the session once to make sure that all spikeglx filetypes
+    # are in the recording folders found
+    spikeglx_endings = (".lf.meta", ".lf.bin", ".ap.meta", ".ap.bin")
+
+    # joined the same way as the walk joins paths, so that e.g. "." sessions match too
+    session_str = os.fspath(session_path)
+    recording_dirs = {
+        os.path.join(session_str, recording_path.name)
+        for recording_path in recording_folder_paths
+    }
+
+    for root, dirnames, filenames in _walk(session_path, listing):
+        # don't descend into the recording folders,
+        # their files are collected by walking them on their own below
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if os.path.join(root, dirname) not in recording_dirs
+        ]
+
+        for filename in filenames:
+            if filename.endswith(spikeglx_endings):
                 raise ValueError(
-                    f"{spikeglx_filepath} is not in any known recording folders."
+                    f"{Path(root, filename)} is not in any known recording folders."
                 )
 
+    # walk the recording folders from their own paths to collect the files,
+    # because the session walk doesn't descend into symlinked recording folders
     ephys_files = [
-        p
-        for recording_folder in recording_folder_paths
-        for p in recording_folder.glob("**/*")
-        if p.is_file()
+        Path(root, filename)
+        for recording_path in recording_folder_paths
+        for root, _, filenames in _walk(recording_path, listing)
+        for filename in filenames
     ]
 
     return ephys_files
@@ -349,6 +580,7 @@ def validate_raw_ephys_data_of_session(
 def validate_raw_ephys_recording(
     gid_folder_path: Path,
     allowed_extensions_not_in_root: tuple[str, ...],
+    listing: DirectoryListing | None = None,
 ) -> bool:
     """
     Validate a single electrophysiology recording, making sure that subfolders and files
@@ -362,6 +594,9 @@ def validate_raw_ephys_recording(
         A tuple of file extensions that are allowed in the session directory excluding the root level.
         E.g. (".txt", )
         For what's allowed in the root, use `whitelisted_files_in_root`.
+    listing : DirectoryListing, optional
+        Listing of the session's directory tree made in advance.
+        If given, directory contents are read from it instead of the file system.
 
     Returns
     -------
@@ -381,26 +616,41 @@ def validate_raw_ephys_recording(
 
     # validate that there are only subfolders in the recording's folder
     # hidden files are allowed
-    probe_subfolders = []
-    for child in gid_folder_path.iterdir():
+    # make sure the extensions have the leading dot so that they can be matched with endswith
+    allowed_extensions_not_in_root = tuple(
+        ext if ext.startswith(".") else "." + ext for ext in allowed_extensions_not_in_root
+    )
+
+    recording_dirnames, recording_filenames = _list_directory(gid_folder_path, listing)
+    for filename in recording_filenames:
         # hidden files are allowed
-        if child.match(".*"):
+        if filename.startswith("."):
             continue
 
         # files with some extensions are allowed and will be renamed and uploaded
-        if child.suffix in allowed_extensions_not_in_root:
+        if filename.endswith(allowed_extensions_not_in_root):
             continue
 
-        if not child.is_dir():
-            raise ValueError("Only folders are allowed in the ephys recordings folder")
+        raise ValueError("Only folders are allowed in the ephys recordings folder")
 
-        # the directories should be the probes' subfolders
-        probe_subfolders.append(child)
+    # the directories should be the probes' subfolders
+    probe_subfolders = [
+        gid_folder_path / dirname
+        for dirname in recording_dirnames
+        if not dirname.startswith(".")
+        and not dirname.endswith(allowed_extensions_not_in_root)
+    ]
 
     # validate that the probe subfolders have the expected name
-    probe_subfolder_pattern = rf"{gid_folder_path.name}_imec\d$"
+    # expected to be <gid_folder_name>_imec<digit>, which is cheap to check without a regex
+    probe_subfolder_prefix = gid_folder_path.name + "_imec"
     for probe_folder in probe_subfolders:
-        if re.match(probe_subfolder_pattern, probe_folder.name) is None:
+        probe_folder_name = probe_folder.name
+        if not (
+            probe_folder_name.startswith(probe_subfolder_prefix)
+            and len(probe_folder_name) == len(probe_subfolder_prefix) + 1
+            and probe_folder_name[-1].isdecimal()
+        ):
             raise ValueError(
                 f"The following folder name doesn't match the expected format for probes: {probe_folder}"
             )
@@ -412,10 +662,17 @@ def validate_raw_ephys_recording(
         expected_filenames = {
             f"{gid_folder_path.name}_t0.{imec_str}{ending}" for ending in expected_endings
         }
-        # Only include files in found_filenames
-        found_filenames = {p.name for p in probe_folder.iterdir() if p.is_file()}
-        if not expected_filenames.issubset(found_filenames):
-            raise ValueError(f"Expected files not found in probe directory: {probe_folder}")
+        # tick off the expected files while listing the folder
+        # other files and folders are allowed, e.g. channel maps or sorting outputs
+        missing_filenames = set(expected_filenames)
+        _, probe_filenames = _list_directory(probe_folder, listing)
+        for filename in probe_filenames:
+            missing_filenames.discard(filename)
+
+        if len(missing_filenames) > 0:
+            raise ValueError(
+                f"Expected files not found in probe directory: {probe_folder}. Missing: {sorted(missing_filenames)}"
+            )
 
     return True
 
@@ -426,11 +683,7 @@ def extract_gid(folder_name: str) -> str:
 
     Example: M016_2023_08_15_16_00_g1 -> g1
     """
-    # TODO can there be multiple numbers after the _g?
-    # SPIKEGLX_RECORDING_PATTERN = r"_g(\d+)$"
-    SPIKEGLX_RECORDING_PATTERN = r"_g(\d)$"
-
-    gid_search_result = re.search(SPIKEGLX_RECORDING_PATTERN, folder_name)
+    gid_search_result = _SPIKEGLX_GID_RE.search(folder_name)
 
     if gid_search_result is None:
         raise ValueError(f"Could not extract correct recording ID from {folder_name}")
@@ -442,6 +695,8 @@ def validate_raw_videos_of_session(
     session_path: Path,
     subject_name: str,
     warn_if_no_video_folder: bool = True,
+    _skip_path_validation: bool = False,
+    listing: DirectoryListing | None = None,
 ) -> list[Path]:
     """
     Validate that the videos are in a folder that has the expected name, and that the files
@@ -457,13 +712,20 @@ def validate_raw_videos_of_session(
         Name of the subject. (Needed for validation.)
     warn_if_no_video_folder : bool, default: True
         Whether to warn if the video folder is not found.
+    _skip_path_validation : bool, default: False
+        Whether to skip validating the session's path.
+        Used by `validate_raw_session`, which validates it once for all validators.
+    listing : DirectoryListing, optional
+        Listing of the session's directory tree made in advance.
+        If given, directory contents are read from it instead of the file system.
 
     Returns
     -------
     List of files in the video folder if it exists, None otherwise.
     """
     # validate that the session's path and folder name are in the expected format
-    validate_session_path(session_path, subject_name)
+    if not _skip_path_validation:
+        validate_session_path(session_path, subject_name)
 
     video_extension = ".avi"
 
@@ -483,7 +745,20 @@ def validate_raw_videos_of_session(
         video_folder_exists = True
 
         # validate that the folder contains .avi files and a metadata.csv
-        avi_files = list(video_folder_path.glob(rf"*{video_extension}"))
+        # and nothing else, listing the folder only once
+        avi_files = []
+        has_metadata = False
+        n_unexpected_files = 0
+        video_folder_dirnames, video_folder_filenames = _list_directory(
+            video_folder_path, listing
+        )
+        for name in video_folder_dirnames + video_folder_filenames:
+            if name.endswith(video_extension):
+                avi_files.append(video_folder_path / name)
+            elif name == "metadata.csv":
+                has_metadata = True
+            else:
+                n_unexpected_files += 1
 
         if len(avi_files) == 0:
             raise FileNotFoundError(
@@ -496,33 +771,48 @@ def validate_raw_videos_of_session(
                     f"Video filename does not start with {expected_video_filename_start}: {avi_file}"
                 )
 
-        # make sure the only remaining file is the metadata.csv
-        remaining_files_in_folder = set(video_folder_path.iterdir()).difference(avi_files)
-
-        if (video_folder_path / "metadata.csv") not in remaining_files_in_folder:
+        if not has_metadata:
             raise FileNotFoundError(
                 f"Could not find metadata.csv in video folder {video_folder_path}"
             )
 
-        if len(remaining_files_in_folder) > 1:
+        if n_unexpected_files > 0:
             raise ValueError(f"Found unexpected files in video folder {video_folder_path}")
 
-    # make sure there are no avi files in another directory
-    for avi_path in session_path.glob(rf"**/*{video_extension}"):
-        if not avi_path.is_relative_to(video_folder_path):
-            raise ValueError(
-                f"Found {video_extension} file in unexpected location: {avi_path}. Expected it to be in {video_folder_path}"
-            )
+    # make sure there are no avi or metadata.csv files in another directory
+    # walk the session once to collect both kinds of misplaced files
+    session_str = os.fspath(session_path)
+    misplaced_avi_paths = []
+    misplaced_metadata_paths = []
+    for root, dirnames, filenames in _walk(session_path, listing):
+        # don't descend into the video folder, its files are collected on their own below
+        if root == session_str and video_folder_name in dirnames:
+            dirnames.remove(video_folder_name)
+
+        for filename in filenames:
+            if filename.endswith(video_extension):
+                misplaced_avi_paths.append(Path(root, filename))
+            elif filename == "metadata.csv":
+                misplaced_metadata_paths.append(Path(root, filename))
+
+    if len(misplaced_avi_paths) > 0:
+        raise ValueError(
+            f"Found {video_extension} file in unexpected location: {misplaced_avi_paths[0]}. Expected it to be in {video_folder_path}"
+        )
 
-    # make sure there are no metadata.csv files in another directory
-    for metadata_path in session_path.glob("**/metadata.csv"):
-        if not metadata_path.is_relative_to(video_folder_path):
-            raise ValueError(
-                f"Found metadata.csv file in unexpected location: {metadata_path}. Expected it to be in {video_folder_path}"
-            )
+    if len(misplaced_metadata_paths) > 0:
+        raise ValueError(
+            f"Found metadata.csv file in unexpected location: {misplaced_metadata_paths[0]}. Expected it to be in {video_folder_path}"
+        )
 
+    # walk the video folder from its own path to collect the files,
+    # because the session walk doesn't descend into a symlinked video folder
     if video_folder_exists:
-        return [p for p in video_folder_path.glob("**/*") if p.is_file()]
+        return [
+            Path(root, filename)
+            for root, _, filenames in _walk(video_folder_path, listing)
+            for filename in filenames
+        ]
 
     return []
 
@@ -8,7 +8,12 @@ import pytest
 from generate_directory_structure_test_cases import create_directory_structure_from_dict
 from ruamel.yaml import YAML
 
-from beneuro_data.data_validation import WrongNumberOfFilesError, validate_raw_session
+from beneuro_data.data_validation import (
+    WrongNumberOfFilesError,
+    validate_date_format,
+    validate_raw_session,
+    validate_raw_sessions_batch,
+)
 
 TEST_DIR_PATH = os.path.dirname(__file__)
 DIRECTORY_STRUCTURE_YAML_FOLDER = os.path.join(
@@ -258,3 +263,141 @@ def test_num_valid_sessions(tmp_path, test_case: NumValidSessionsTestCase):
         tmp_path, NUM_VALID_SESSIONS_YAML_FOLDER, test_case.yaml_name
     )
     test_case.run_test(tmp_path)
+
+
+@pytest.mark.parametrize("test_case", num_valid_sessions_test_cases)
+def test_num_valid_sessions_batch(tmp_path, test_case: NumValidSessionsTestCase):
+    _prepare_directory_structure(
+        tmp_path, NUM_VALID_SESSIONS_YAML_FOLDER, test_case.yaml_name
+    )
+
+    valid_sessions, invalid_sessions = validate_raw_sessions_batch(
+        tmp_path / "raw",
+        (test_case.mouse_name,),
+        True,
+        True,
+        True,
+        WHITELISTED_FILES_IN_ROOT,
+        EXTENSIONS_TO_RENAME_AND_UPLOAD,
+    )
+
+    assert len(valid_sessions) == test_case.n_valid_sessions
+
+    # the batch has to find the same files as validating the sessions one by one
+    for session_path, found_files in valid_sessions.items():
+        expected_files = validate_raw_session(
+            session_path,
+            test_case.mouse_name,
+            True,
+            True,
+            True,
+            WHITELISTED_FILES_IN_ROOT,
+            EXTENSIONS_TO_RENAME_AND_UPLOAD,
+        )
+        for found, expected in zip(found_files, expected_files):
+            assert sorted(found) == sorted(expected)
+
+    for session_path, error in invalid_sessions.items():
+        with pytest.raises(type(error)):
+            validate_raw_session(
+                session_path,
+                test_case.mouse_name,
+                True,
+                True,
+                True,
+                WHITELISTED_FILES_IN_ROOT,
+                EXTENSIONS_TO_RENAME_AND_UPLOAD,
+            )
+
+
+def test_validate_date_format_valid():
+    assert validate_date_format("2023_08_15_16_00")
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "2023_8_15_16_00",
+        "2023-08-15-16-00",
+        "2023_13_15_16_00",
+        "2023_02_30_16_00",
+        "2023_08_15_24_00",
+        "2023_08_15_16_00_00",
+    ],
+)
+def test_validate_date_format_invalid(date_str: str):
+    with pytest.raises(ValueError, match="expected format"):
+        validate_date_format(date_str)
+
+
+def _move_and_symlink(path: pathlib.Path, new_parent: pathlib.Path) -> pathlib.Path:
+    # move a folder to another location and leave a symlink pointing to it behind
+    new_parent.mkdir(parents=True, exist_ok=True)
+    new_path = new_parent / path.name
+    shutil.move(path, new_path)
+    path.symlink_to(new_path, target_is_directory=True)
+
+    return new_path
+
+
+def test_symlinked_recording_folder(tmp_path):
+    _prepare_directory_structure(
+        tmp_path, DIRECTORY_STRUCTURE_YAML_FOLDER, "M011_correct.yaml"
+    )
+    session_path = tmp_path / "raw" / "M011" / "M011_2023_04_04_16_00"
+    _move_and_symlink(session_path / "M011_2023_04_04_16_00_g1", tmp_path / "other_disk")
+
+    _, ephys_files, _, _, _, _ = validate_raw_session(
+        session_path,
+        "M011",
+        True,
+        True,
+        True,
+        WHITELISTED_FILES_IN_ROOT,
+        EXTENSIONS_TO_RENAME_AND_UPLOAD,
+    )
+    assert len([p for p in ephys_files if p.suffix in (".bin", ".meta")]) == 4
+
+    valid_sessions, _ = validate_raw_sessions_batch(
+        tmp_path / "raw",
+        ("M011",),
+        True,
+        True,
+        True,
+        WHITELISTED_FILES_IN_ROOT,
+        EXTENSIONS_TO_RENAME_AND_UPLOAD,
+    )
+    assert sorted(valid_sessions[session_path][1]) == sorted(ephys_files)
+
+
+def test_symlinked_video_folder(tmp_path):
+    _prepare_directory_structure(
+        tmp_path, DIRECTORY_STRUCTURE_YAML_FOLDER, "M011_correct.yaml"
+    )
+    session_path = tmp_path / "raw" / "M011" / "M011_2023_04_04_16_00"
+    _move_and_symlink(
+        session_path / "M011_2023_04_04_16_00_cameras", tmp_path / "other_disk"
+    )
+
+    _, _, video_files, _, _, _ = validate_raw_session(
+        session_path,
+        "M011",
+        True,
+        True,
+        True,
+        WHITELISTED_FILES_IN_ROOT,
+        EXTENSIONS_TO_RENAME_AND_UPLOAD,
+    )
+    # 5 videos and the metadata.csv
+    assert len(video_files) == 6
+
+    valid_sessions, _ = validate_raw_sessions_batch(
+        tmp_path / "raw",
+        ("M011",),
+        True,
+        True,
+        True,
+        WHITELISTED_FILES_IN_ROOT,
+        EXTENSIONS_TO_RENAME_AND_UPLOAD,
+    )
+    assert sorted(valid_sessions[session_path][2]) == sorted(video_files)